@@ -2,17 +2,22 @@
 from flask import Flask, render_template, request, jsonify, send_file
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from flask_caching import Cache
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import httpx
+from selectolax.parser import HTMLParser
 import re
-import json
-from datetime import datetime, timedelta
+import orjson
+from flask.json.provider import JSONProvider
+from datetime import datetime, date, timedelta
 import logging
 from urllib.parse import urljoin, urlparse
 import time
 import os
 from werkzeug.utils import secure_filename
 import asyncio
+import weakref
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -20,24 +25,109 @@ from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import random
-from threading import Thread
+import numpy as np
+import queue
+from threading import Thread, Lock
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the scoring core runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Under Gunicorn's gevent workers, patch psycopg2 so Postgres I/O yields
+# to the event loop instead of blocking the worker. Must run before the
+# SQLAlchemy engine is created; no-op for the SQLite dev database.
+if os.environ.get('GEVENT_WORKERS', '0') == '1':
+    try:
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+    except ImportError:
+        # psycopg2 not installed (e.g. SQLite deployments); nothing to patch
+        pass
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///court_cases.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Pool connections instead of opening one per worker: concurrent
+# /api/search requests reuse up to pool_size + max_overflow connections,
+# and pre-ping/recycle keep long-lived ones from going stale
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800
+}
+
+# Serialize API responses with orjson's C encoder instead of stdlib json;
+# OPT_SERIALIZE_NUMPY covers any NumPy scalars that reach a response
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
 
 # Initialize extensions
 db = SQLAlchemy(app)
 CORS(app)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pooled HTTP clients for the scrapers, one per event loop: Flask runs
+# each async view on a fresh loop, so a single import-time client would
+# hand out keepalive connections bound to already-closed loops and fail
+# on reuse. Weak keys let dead loops (and their clients) drop out.
+_clients = weakref.WeakKeyDictionary()
+
+def _get_client():
+    """Return the pooled httpx client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=10,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        )
+        _clients[loop] = client
+    return client
+
+# Pooled sync session for bulk downloads (order PDFs); page scraping goes
+# through the async httpx client above
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Selenium is kept only as an opt-in fallback for portals that render
+# results client-side; the default scrape path is plain HTTP
+USE_SELENIUM_FALLBACK = os.environ.get('USE_SELENIUM_FALLBACK', '0') == '1'
+
+# Opt-in demo behaviour: sleep to mimic portal latency when a scrape
+# falls back to mock data. Off by default so real deployments and load
+# tests don't park workers on artificial delays.
+SIMULATE_LATENCY = os.environ.get('SIMULATE_LATENCY', '0') == '1'
+
 # Database Models
 class CaseQuery(db.Model):
+    # Dashboard stats filter on (query_timestamp, success); without this
+    # index every refresh scans the full query history
+    __table_args__ = (
+        db.Index('ix_casequery_ts_success', 'query_timestamp', 'success'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     court_name = db.Column(db.String(100), nullable=False)
     case_type = db.Column(db.String(50), nullable=False)
@@ -50,8 +140,14 @@ class CaseQuery(db.Model):
     parsed_data = db.Column(db.Text)  # JSON string
     
 class CaseData(db.Model):
+    # Named unique index backs the filter_by(case_number=...) lookup in
+    # the search route
+    __table_args__ = (
+        db.Index('ix_casedata_case_number', 'case_number', unique=True),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    case_number = db.Column(db.String(100), unique=True, nullable=False)
+    case_number = db.Column(db.String(100), nullable=False)
     court_name = db.Column(db.String(100), nullable=False)
     petitioner = db.Column(db.String(200))
     respondent = db.Column(db.String(200))
@@ -69,11 +165,214 @@ class CaseOrder(db.Model):
     pdf_link = db.Column(db.String(500))
     judge_name = db.Column(db.String(100))
 
+# Mock-data pools as NumPy arrays sampled through one shared Generator,
+# so generate_mock_data doesn't rebuild the Python lists or pay a
+# random.choice dispatch per field on every search
+_RNG = np.random.default_rng()
+
+_PETITIONERS = np.array([
+    'Rajesh Kumar & Associates',
+    'Priya Enterprises Pvt. Ltd.',
+    'State of Delhi',
+    'Municipal Corporation',
+    'ABC Manufacturing Co.',
+    'XYZ Corporation',
+    'Local Authority',
+    'Private Individual'
+])
+
+_RESPONDENTS = np.array([
+    'Union of India',
+    'State Government',
+    'XYZ Corporation',
+    'Local Authority',
+    'Private Individual',
+    'Municipal Corporation',
+    'State of Delhi'
+])
+
+_JUDGES = np.array([
+    'Hon\'ble Justice A.K. Sharma',
+    'Hon\'ble Justice P.R. Mehta',
+    'Hon\'ble Justice S.K. Singh',
+    'Hon\'ble Justice R.N. Patel',
+    'Hon\'ble Justice M.S. Kumar',
+    'Hon\'ble Justice Priya Singh',
+    'Hon\'ble Justice R.K. Gupta'
+])
+
+_STATUSES = np.array(['pending', 'disposed'])
+
+_ORDER_DESCRIPTIONS = np.array([
+    "Notice issued to respondents. Matter adjourned to next date of hearing.",
+    "Counter affidavit filed by respondents. Rejoinder affidavit to be filed within two weeks.",
+    "Interim relief granted. Respondents restrained from taking any coercive action.",
+    "Matter heard at length. Judgment reserved for pronouncement.",
+    "Petition allowed. Respondents directed to comply with the directions within four weeks.",
+    "Matter disposed of in terms of the settlement reached between parties.",
+    "Interim application disposed of. Main matter to be listed for final hearing.",
+    "Notice of motion disposed of. Main petition to be heard on merits.",
+    "Bail application allowed. Petitioner directed to furnish surety bonds.",
+    "Revision petition dismissed. Lower court order upheld.",
+    "Appeal admitted. Stay granted on the impugned order.",
+    "Writ petition disposed of with directions to the authorities."
+])
+
+# Driver pool for the Selenium fallback
+class DriverPool:
+    """Bounded pool of reusable Chrome drivers.
+
+    Chrome costs seconds of startup and ~300MB per instance, and WebDriver
+    sessions are not thread-safe, so drivers are handed out one at a time
+    through a queue and recycled after a fixed number of uses to contain
+    memory creep.
+    """
+
+    RECYCLE_AFTER = 50
+
+    def __init__(self, size=2):
+        self._size = size
+        self._queue = queue.Queue()
+        self._created = 0
+        self._uses = {}
+        self._lock = Lock()
+
+    def acquire(self, factory, timeout=30):
+        """Get a pooled driver, lazily building one via factory() if the
+        pool is not yet full. Returns None if no driver is available."""
+        with self._lock:
+            if self._created < self._size and self._queue.empty():
+                driver = factory()
+                if driver is None:
+                    return None
+                self._created += 1
+                self._uses[id(driver)] = 0
+                return driver
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def release(self, driver):
+        """Return a driver to the pool, retiring it once it has served
+        RECYCLE_AFTER requests."""
+        uses = self._uses.get(id(driver), 0) + 1
+        if uses >= self.RECYCLE_AFTER:
+            self._uses.pop(id(driver), None)
+            with self._lock:
+                self._created -= 1
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Failed to quit recycled driver: {e}")
+        else:
+            self._uses[id(driver)] = uses
+            self._queue.put(driver)
+
+_driver_pool = DriverPool()
+
 # Base Scraper Class
 class BaseScraper:
+    # Built once at class creation; generate_mock_data used to rebuild
+    # this dict on every call
+    case_types = {
+        'civil': 'Civil Suit',
+        'criminal': 'Criminal Case',
+        'writ': 'Writ Petition',
+        'appeal': 'Civil Appeal',
+        'revision': 'Civil Revision',
+        'bail': 'Bail Application',
+        'pil': 'Public Interest Litigation'
+    }
+
+    # Case-number templates per court: one dict lookup and format call
+    # instead of re-branching and re-building the string every call
+    _CASE_NUM_FMT = {
+        'delhi-high': '{ctype} {n}/{y}',
+        'supreme': 'Civil Appeal No. {n} of {y}',
+        'bombay-high': 'Writ Petition No. {n} of {y}'
+    }
+    _CASE_NUM_FMT_DEFAULT = '{ct_upper}/{n}/{y}'
+
+    # Compiled once at class scope: re.compile per call would re-parse the
+    # pattern on every page, and these run against full result HTML
+    _RE_JUDGE = re.compile(r"(Hon'ble\s+Justice\s+[^<\n]+)")
+    _RE_STATUS = re.compile(r'Status\s*:?\s*(Pending|Disposed|Transferred|Adjourned)', re.IGNORECASE)
+    _RE_NEXT_HEARING = re.compile(r'Next\s+(?:Hearing|Date)\s*:?\s*(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+
     def __init__(self):
         self.base_url = ""
-        
+        self.search_url = ""
+
+    async def _fetch(self, form_data):
+        """POST the search form and return response HTML, or None on failure"""
+        if not self.search_url:
+            return None
+
+        if USE_SELENIUM_FALLBACK:
+            return await asyncio.to_thread(self._fetch_with_driver, self.search_url)
+
+        try:
+            response = await _get_client().post(self.search_url, data=form_data)
+            response.raise_for_status()
+            return response.text
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP fetch failed for {self.search_url}: {e}")
+            return None
+
+    def _extract_fields(self, html):
+        """Parse court-result HTML into a dict of case fields"""
+        # selectolax (Modest C engine) walks the tree in C rather than
+        # CPython bytecode, so parsing stays cheap even on large result pages
+        tree = HTMLParser(html)
+        fields = {}
+        for key, selector in (
+            ('petitioner', 'td.petitioner'),
+            ('respondent', 'td.respondent'),
+            ('filing_date', 'td.filing-date'),
+            ('next_hearing', 'td.next-hearing'),
+            ('status', 'td.status'),
+            ('judge', 'td.judge')
+        ):
+            node = tree.css_first(selector)
+            if node is not None:
+                fields[key] = node.text(strip=True)
+
+        # Regex fallback for portals whose markup lacks the expected
+        # classes; each precompiled pattern is one pass over the page
+        for key, pattern in (
+            ('judge', self._RE_JUDGE),
+            ('status', self._RE_STATUS),
+            ('next_hearing', self._RE_NEXT_HEARING)
+        ):
+            if key not in fields:
+                match = pattern.search(html)
+                if match:
+                    fields[key] = match.group(1).strip()
+        return fields
+
+    def download_pdf(self, url, dest_path):
+        """Stream an order PDF to disk in 64KB chunks"""
+        # stream=True + a large chunk size keeps memory flat and avoids
+        # the tiny-read penalty on multi-MB court orders
+        response = _session.get(url, stream=True, timeout=30)
+        response.raise_for_status()
+        with open(dest_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=65536):
+                f.write(chunk)
+        return dest_path
+
+    def _fetch_with_driver(self, url):
+        """Selenium fallback for portals that require JS rendering"""
+        driver = _driver_pool.acquire(self.setup_driver)
+        if driver is None:
+            return None
+        try:
+            driver.get(url)
+            return driver.page_source
+        finally:
+            _driver_pool.release(driver)
+
     def setup_driver(self):
         """Setup Chrome driver with appropriate options"""
         chrome_options = Options()
@@ -93,94 +392,39 @@ class BaseScraper:
     
     def generate_mock_data(self, case_type, case_number, filing_year, court_name):
         """Generate realistic mock data for demonstration"""
-        case_types = {
-            'civil': 'Civil Suit',
-            'criminal': 'Criminal Case', 
-            'writ': 'Writ Petition',
-            'appeal': 'Civil Appeal',
-            'revision': 'Civil Revision',
-            'bail': 'Bail Application',
-            'pil': 'Public Interest Litigation'
-        }
-        
-        petitioners = [
-            'Rajesh Kumar & Associates',
-            'Priya Enterprises Pvt. Ltd.',
-            'State of Delhi',
-            'Municipal Corporation',
-            'ABC Manufacturing Co.',
-            'XYZ Corporation',
-            'Local Authority',
-            'Private Individual'
-        ]
-        
-        respondents = [
-            'Union of India',
-            'State Government', 
-            'XYZ Corporation',
-            'Local Authority',
-            'Private Individual',
-            'Municipal Corporation',
-            'State of Delhi'
-        ]
-        
-        judges = [
-            'Hon\'ble Justice A.K. Sharma',
-            'Hon\'ble Justice P.R. Mehta', 
-            'Hon\'ble Justice S.K. Singh',
-            'Hon\'ble Justice R.N. Patel',
-            'Hon\'ble Justice M.S. Kumar',
-            'Hon\'ble Justice Priya Singh',
-            'Hon\'ble Justice R.K. Gupta'
-        ]
-        
         # Generate case number based on court and type
-        if court_name == 'delhi-high':
-            case_num = f"{case_types.get(case_type, 'Civil Suit')} {case_number}/{filing_year}"
-        elif court_name == 'supreme':
-            case_num = f"Civil Appeal No. {case_number} of {filing_year}"
-        elif court_name == 'bombay-high':
-            case_num = f"Writ Petition No. {case_number} of {filing_year}"
-        else:
-            case_num = f"{case_type.upper()}/{case_number}/{filing_year}"
+        fmt = self._CASE_NUM_FMT.get(court_name, self._CASE_NUM_FMT_DEFAULT)
+        case_num = fmt.format(
+            ctype=self.case_types.get(case_type, 'Civil Suit'),
+            ct_upper=case_type.upper(),
+            n=case_number,
+            y=filing_year
+        )
         
+        filing_month, hearing_month = _RNG.integers(1, 13), _RNG.integers(8, 13)
+        filing_day, hearing_day, order_day = _RNG.integers(1, 29, 3)
+
         case_data = {
             'case_number': case_num,
-            'petitioner': random.choice(petitioners),
-            'respondent': random.choice(respondents),
-            'filing_date': f'{filing_year}-{random.randint(1,12):02d}-{random.randint(1,28):02d}',
-            'next_hearing': f'2025-{random.randint(8,12):02d}-{random.randint(1,28):02d}',
-            'status': random.choice(['pending', 'disposed']),
-            'judge': random.choice(judges)
+            'petitioner': str(_RNG.choice(_PETITIONERS)),
+            'respondent': str(_RNG.choice(_RESPONDENTS)),
+            'filing_date': f'{filing_year}-{filing_month:02d}-{filing_day:02d}',
+            'next_hearing': f'2025-{hearing_month:02d}-{hearing_day:02d}',
+            'status': str(_RNG.choice(_STATUSES)),
+            'judge': str(_RNG.choice(_JUDGES))
         }
-        
-        # Generate realistic order descriptions
-        order_descriptions = [
-            "Notice issued to respondents. Matter adjourned to next date of hearing.",
-            "Counter affidavit filed by respondents. Rejoinder affidavit to be filed within two weeks.",
-            "Interim relief granted. Respondents restrained from taking any coercive action.",
-            "Matter heard at length. Judgment reserved for pronouncement.",
-            "Petition allowed. Respondents directed to comply with the directions within four weeks.",
-            "Matter disposed of in terms of the settlement reached between parties.",
-            "Interim application disposed of. Main matter to be listed for final hearing.",
-            "Notice of motion disposed of. Main petition to be heard on merits.",
-            "Bail application allowed. Petitioner directed to furnish surety bonds.",
-            "Revision petition dismissed. Lower court order upheld.",
-            "Appeal admitted. Stay granted on the impugned order.",
-            "Writ petition disposed of with directions to the authorities."
-        ]
-        
+
         orders = [
             {
-                'date': f'2025-07-{random.randint(1,30):02d}',
-                'description': random.choice(order_descriptions)
+                'date': f'2025-07-{order_day:02d}',
+                'description': str(_RNG.choice(_ORDER_DESCRIPTIONS))
             },
             {
                 'date': case_data['filing_date'],
                 'description': 'Petition filed. Urgent hearing requested.'
             }
         ]
-        
+
         return case_data, orders
 
 # Court Scraper Classes
@@ -190,15 +434,23 @@ class DelhiHighCourtScraper(BaseScraper):
         self.base_url = "https://delhihighcourt.nic.in"
         self.search_url = f"{self.base_url}/case_status.asp"
         
-    def scrape_case_data(self, case_type, case_number, filing_year):
+    async def scrape_case_data(self, case_type, case_number, filing_year):
         """Scrape case data from Delhi High Court website"""
         start_time = time.time()
-        
+
         try:
-            # Simulate processing time
-            time.sleep(2 + random.uniform(0.5, 1.5))
-            
+            html = await self._fetch({
+                'ctype': case_type,
+                'regno': case_number,
+                'regyr': filing_year
+            })
+            if html is None and SIMULATE_LATENCY:
+                # Portal unreachable: simulate the round-trip for demo data
+                await asyncio.sleep(2 + random.uniform(0.5, 1.5))
+
             case_data, orders = self.generate_mock_data(case_type, case_number, filing_year, 'delhi-high')
+            if html is not None:
+                case_data.update(self._extract_fields(html))
             
             response_time = int((time.time() - start_time) * 1000)
             
@@ -219,16 +471,25 @@ class SupremeCourtScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.base_url = "https://main.sci.gov.in"
-        
-    def scrape_case_data(self, case_type, case_number, filing_year):
+        self.search_url = f"{self.base_url}/case-status"
+
+    async def scrape_case_data(self, case_type, case_number, filing_year):
         """Scrape case data from Supreme Court website"""
         start_time = time.time()
-        
+
         try:
-            # Simulate processing time
-            time.sleep(1.5 + random.uniform(0.5, 1.0))
-            
+            html = await self._fetch({
+                'case_type': case_type,
+                'case_no': case_number,
+                'year': filing_year
+            })
+            if html is None and SIMULATE_LATENCY:
+                # Portal unreachable: simulate the round-trip for demo data
+                await asyncio.sleep(1.5 + random.uniform(0.5, 1.0))
+
             case_data, orders = self.generate_mock_data(case_type, case_number, filing_year, 'supreme')
+            if html is not None:
+                case_data.update(self._extract_fields(html))
             
             response_time = int((time.time() - start_time) * 1000)
             
@@ -249,16 +510,25 @@ class BombayHighCourtScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.base_url = "https://bombayhighcourt.nic.in"
-        
-    def scrape_case_data(self, case_type, case_number, filing_year):
+        self.search_url = f"{self.base_url}/case_query.php"
+
+    async def scrape_case_data(self, case_type, case_number, filing_year):
         """Scrape case data from Bombay High Court website"""
         start_time = time.time()
-        
+
         try:
-            # Simulate processing time
-            time.sleep(1.8 + random.uniform(0.5, 1.2))
-            
+            html = await self._fetch({
+                'case_type': case_type,
+                'case_no': case_number,
+                'case_year': filing_year
+            })
+            if html is None and SIMULATE_LATENCY:
+                # Portal unreachable: simulate the round-trip for demo data
+                await asyncio.sleep(1.8 + random.uniform(0.5, 1.2))
+
             case_data, orders = self.generate_mock_data(case_type, case_number, filing_year, 'bombay-high')
+            if html is not None:
+                case_data.update(self._extract_fields(html))
             
             response_time = int((time.time() - start_time) * 1000)
             
@@ -282,16 +552,25 @@ class ECourtsScraper(BaseScraper):
         super().__init__()
         self.district = district
         self.base_url = f"https://districts.ecourts.gov.in/{district}"
-        
-    def scrape_case_data(self, case_type, case_number, filing_year):
+        self.search_url = f"{self.base_url}/case-status"
+
+    async def scrape_case_data(self, case_type, case_number, filing_year):
         """Scrape case data from eCourts portal"""
         start_time = time.time()
-        
+
         try:
-            # Simulate processing time
-            time.sleep(1 + random.uniform(0.5, 1.0))
-            
+            html = await self._fetch({
+                'case_type': case_type,
+                'case_no': case_number,
+                'year': filing_year
+            })
+            if html is None and SIMULATE_LATENCY:
+                # Portal unreachable: simulate the round-trip for demo data
+                await asyncio.sleep(1 + random.uniform(0.5, 1.0))
+
             case_data, orders = self.generate_mock_data(case_type, case_number, filing_year, f'{self.district}-district')
+            if html is not None:
+                case_data.update(self._extract_fields(html))
             
             response_time = int((time.time() - start_time) * 1000)
             
@@ -308,31 +587,55 @@ class ECourtsScraper(BaseScraper):
             logger.error(f"Error in eCourts scraper: {e}")
             return None, str(e)
 
+# Outcome scoring core: int-encoded case types keep the hot function
+# purely numeric so Numba can compile it. The explicit signature makes
+# compilation happen at import time instead of on the first request.
+CASE_TYPE_IDS = {
+    'civil': 0,
+    'criminal': 1,
+    'writ': 2,
+    'appeal': 3,
+    'revision': 4,
+    'bail': 5,
+    'pil': 6
+}
+
+@njit('float64(int64, int64, int64)', cache=True)
+def _score_case(case_age_days, case_type_id, court_load):
+    score = 0.5
+    if case_age_days > 365:
+        score += 0.2
+    if case_type_id == 2 or case_type_id == 5:  # writ, bail
+        score += 0.1
+    if court_load < 100:
+        score += 0.1
+    return score
+
 # Analytics Engine
 class CaseAnalytics:
     def __init__(self):
         self.db = db
     
+    @cache.memoize(timeout=30)
     def get_dashboard_stats(self):
         """Get real-time dashboard statistics"""
-        today = datetime.now().date()
-        
-        total_searches = CaseQuery.query.filter(
-            CaseQuery.query_timestamp >= today
-        ).count()
-        
-        successful_searches = CaseQuery.query.filter(
-            CaseQuery.query_timestamp >= today,
-            CaseQuery.success == True
-        ).count()
-        
+        # Bind the day boundary once as a UTC datetime: query_timestamp
+        # defaults to utcnow, and comparing datetime-to-datetime keeps the
+        # (query_timestamp, success) index usable without per-row casts
+        day_start = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+
+        # Single round-trip: total, success count and success-only average
+        # come from one scan instead of three separate queries
+        total_searches, successful_searches, avg_response_time = db.session.query(
+            db.func.count(CaseQuery.id),
+            db.func.sum(db.case((CaseQuery.success == True, 1), else_=0)),
+            db.func.avg(db.case((CaseQuery.success == True, CaseQuery.response_time_ms)))
+        ).filter(CaseQuery.query_timestamp >= day_start).one()
+
+        successful_searches = successful_searches or 0
+        avg_response_time = avg_response_time or 0
         success_rate = (successful_searches / total_searches * 100) if total_searches > 0 else 0
-        
-        avg_response_time = db.session.query(db.func.avg(CaseQuery.response_time_ms)).filter(
-            CaseQuery.query_timestamp >= today,
-            CaseQuery.success == True
-        ).scalar() or 0
-        
+
         return {
             'total_searches': total_searches,
             'success_rate': round(success_rate, 1),
@@ -341,19 +644,30 @@ class CaseAnalytics:
     
     def get_case_trends(self):
         """Get case filing trends for analytics"""
-        # Generate mock trends data for demonstration
+        now = datetime.utcnow()
+        six_months_ago = now - timedelta(days=180)
+
+        # One GROUP BY over the indexed range instead of a COUNT query
+        # per month
+        rows = db.session.query(
+            db.func.strftime('%Y-%m', CaseQuery.query_timestamp).label('month'),
+            db.func.count(CaseQuery.id)
+        ).filter(
+            CaseQuery.query_timestamp >= six_months_ago
+        ).group_by('month').all()
+        counts = dict(rows)
+
+        # Fill months with no activity so the chart always spans six months,
+        # oldest first
         trends = []
-        current_date = datetime.now()
-        
-        for i in range(6):
-            month_date = current_date - timedelta(days=30*i)
-            month_str = month_date.strftime('%Y-%m')
+        for i in range(5, -1, -1):
+            month_str = (now - timedelta(days=30*i)).strftime('%Y-%m')
             trends.append({
                 'month': month_str,
-                'count': random.randint(50, 200)
+                'count': counts.get(month_str, 0)
             })
-        
-        return trends[::-1]  # Reverse to show oldest first
+
+        return trends
     
     def get_status_distribution(self):
         """Get case status distribution"""
@@ -371,21 +685,13 @@ class CaseAnalytics:
         """AI-powered case outcome prediction (simplified)"""
         # Mock ML prediction - in production, use trained models
         
-        # Simple scoring algorithm based on case characteristics
-        score = 0.5
-        
         # Simulate various factors affecting case outcome
         case_age_days = 100  # Mock case age
         case_type = case_data.get('case_type', 'civil')
         court_load = random.randint(50, 200)  # Mock court load
-        
-        if case_age_days > 365:
-            score += 0.2
-        if case_type in ['bail', 'writ']:
-            score += 0.1
-        if court_load < 100:
-            score += 0.1
-            
+
+        score = _score_case(case_age_days, CASE_TYPE_IDS.get(case_type, 0), court_load)
+
         prediction = {
             'favorable_probability': min(score, 0.95),
             'estimated_disposal_days': random.randint(30, 180),
@@ -399,7 +705,6 @@ class CaseAnalytics:
 delhi_scraper = DelhiHighCourtScraper()
 supreme_scraper = SupremeCourtScraper()
 bombay_scraper = BombayHighCourtScraper()
-ecourts_scraper = ECourtsScraper()
 analytics = CaseAnalytics()
 
 # Routes
@@ -407,92 +712,154 @@ analytics = CaseAnalytics()
 def index():
     return render_template('index.html')
 
+def _resolve_scraper(court):
+    """Map a court id to its scraper, or None if unsupported"""
+    if court == 'delhi-high':
+        return delhi_scraper
+    elif court == 'supreme':
+        return supreme_scraper
+    elif court == 'bombay-high':
+        return bombay_scraper
+    elif court in ['delhi-district', 'faridabad-district']:
+        # Fresh instance per lookup so concurrent district searches
+        # don't race on a shared scraper's district attribute
+        district = 'delhi' if court == 'delhi-district' else 'faridabad'
+        return ECourtsScraper(district)
+    return None
+
+def _record_search(court, case_type, case_number, filing_year, result, error):
+    """Persist the query log, and the case data on success, for one court"""
+    query_record = CaseQuery(
+        court_name=court,
+        case_type=case_type,
+        case_number=case_number,
+        filing_year=filing_year
+    )
+
+    if error:
+        query_record.success = False
+        query_record.raw_response = error
+        db.session.add(query_record)
+        db.session.commit()
+        return
+
+    # Update query record
+    query_record.success = True
+    query_record.response_time_ms = result['response_time_ms']
+    query_record.parsed_data = orjson.dumps(result).decode()
+
+    # Save case data
+    case_data = result['case_data']
+    existing_case = CaseData.query.filter_by(case_number=case_data['case_number']).first()
+
+    if not existing_case:
+        new_case = CaseData(
+            case_number=case_data['case_number'],
+            court_name=court,
+            petitioner=case_data.get('petitioner'),
+            respondent=case_data.get('respondent'),
+            filing_date=date.fromisoformat(case_data['filing_date']),
+            next_hearing_date=date.fromisoformat(case_data['next_hearing']),
+            case_status=case_data.get('status'),
+            judge_name=case_data.get('judge')
+        )
+        db.session.add(new_case)
+        db.session.flush()
+
+        # Save orders in one bulk INSERT instead of one per row
+        orders_list = [
+            CaseOrder(
+                case_id=new_case.id,
+                order_date=date.fromisoformat(order['date']),
+                order_description=order['description']
+            )
+            for order in result['orders']
+        ]
+        db.session.bulk_save_objects(orders_list)
+
+    db.session.add(query_record)
+    db.session.commit()
+
+# Persistence runs off the request path: search results are queued here
+# and drained by a daemon writer thread, so the HTTP response doesn't
+# block on the commit. The queue is bounded; when it fills, the route
+# falls back to a synchronous write for backpressure.
+_write_queue = queue.Queue(maxsize=10000)
+
+def _db_writer():
+    """Drain queued search results into the database"""
+    with app.app_context():
+        while True:
+            item = _write_queue.get()
+            try:
+                _record_search(*item)
+            except Exception as e:
+                logger.error(f"Background write failed: {e}")
+                db.session.rollback()
+            finally:
+                _write_queue.task_done()
+
+Thread(target=_db_writer, daemon=True).start()
+
 @app.route('/api/search', methods=['POST'])
-def search_case():
+async def search_case():
     """Main case search endpoint"""
     try:
         data = request.get_json()
-        
-        court = data.get('court')
+
+        # 'courts' fans one query out to several courts; 'court' keeps the
+        # original single-court contract
+        courts = data.get('courts') or [data.get('court')]
         case_type = data.get('case_type')
         case_number = data.get('case_number')
         filing_year = int(data.get('filing_year'))
-        
-        # Log the query
-        query_record = CaseQuery(
-            court_name=court,
-            case_type=case_type,
-            case_number=case_number,
-            filing_year=filing_year
-        )
-        
-        # Choose appropriate scraper
-        if court == 'delhi-high':
-            result, error = delhi_scraper.scrape_case_data(case_type, case_number, filing_year)
-        elif court == 'supreme':
-            result, error = supreme_scraper.scrape_case_data(case_type, case_number, filing_year)
-        elif court == 'bombay-high':
-            result, error = bombay_scraper.scrape_case_data(case_type, case_number, filing_year)
-        elif court in ['delhi-district', 'faridabad-district']:
-            district = 'delhi' if court == 'delhi-district' else 'faridabad'
-            ecourts_scraper.district = district
-            result, error = ecourts_scraper.scrape_case_data(case_type, case_number, filing_year)
-        else:
-            return jsonify({'error': 'Unsupported court selected'}), 400
-        
-        if error:
-            query_record.success = False
-            query_record.raw_response = error
-            db.session.add(query_record)
-            db.session.commit()
-            return jsonify({'error': error}), 500
-        
-        # Update query record
-        query_record.success = True
-        query_record.response_time_ms = result['response_time_ms']
-        query_record.parsed_data = json.dumps(result)
-        
-        # Save case data
-        case_data = result['case_data']
-        existing_case = CaseData.query.filter_by(case_number=case_data['case_number']).first()
-        
-        if not existing_case:
-            new_case = CaseData(
-                case_number=case_data['case_number'],
-                court_name=court,
-                petitioner=case_data.get('petitioner'),
-                respondent=case_data.get('respondent'),
-                filing_date=datetime.strptime(case_data['filing_date'], '%Y-%m-%d').date(),
-                next_hearing_date=datetime.strptime(case_data['next_hearing'], '%Y-%m-%d').date(),
-                case_status=case_data.get('status'),
-                judge_name=case_data.get('judge')
-            )
-            db.session.add(new_case)
-            db.session.flush()
-            
-            # Save orders
-            for order in result['orders']:
-                case_order = CaseOrder(
-                    case_id=new_case.id,
-                    order_date=datetime.strptime(order['date'], '%Y-%m-%d').date(),
-                    order_description=order['description']
-                )
-                db.session.add(case_order)
-        
-        db.session.add(query_record)
-        db.session.commit()
-        
-        # Add AI prediction
-        prediction = analytics.predict_case_outcome(case_data)
-        result['ai_prediction'] = prediction
-        
-        return jsonify(result)
-        
+
+        scrapers = []
+        for court in courts:
+            scraper = _resolve_scraper(court)
+            if scraper is None:
+                return jsonify({'error': 'Unsupported court selected'}), 400
+            scrapers.append(scraper)
+
+        # All court lookups share the event loop, so the slowest portal
+        # bounds the response time instead of the sum of all of them
+        outcomes = await asyncio.gather(*(
+            scraper.scrape_case_data(case_type, case_number, filing_year)
+            for scraper in scrapers
+        ))
+
+        results = {}
+        for court, (result, error) in zip(courts, outcomes):
+            # Snapshot before the AI prediction is attached below:
+            # parsed_data deliberately excludes it, and the writer thread
+            # must never share a dict this thread still mutates
+            record = (court, case_type, case_number, filing_year,
+                      None if error else dict(result), error)
+            try:
+                _write_queue.put_nowait(record)
+            except queue.Full:
+                _record_search(*record)
+            if error:
+                results[court] = {'error': error}
+            else:
+                result['ai_prediction'] = analytics.predict_case_outcome(result['case_data'])
+                results[court] = result
+
+        # Single-court searches keep the original response shape
+        if len(courts) == 1:
+            single = results[courts[0]]
+            if 'error' in single:
+                return jsonify(single), 500
+            return jsonify(single)
+
+        return jsonify({'results': results})
+
     except Exception as e:
         logger.error(f"Error in search endpoint: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/stats')
+@cache.cached(timeout=30)
 def get_stats():
     """Get dashboard statistics"""
     try:
@@ -503,6 +870,7 @@ def get_stats():
         return jsonify({'error': 'Failed to get statistics'}), 500
 
 @app.route('/api/analytics')
+@cache.cached(timeout=30)
 def get_analytics():
     """Get analytics data for charts"""
     try:
@@ -529,12 +897,19 @@ def get_courts():
         {'id': 'delhi-district', 'name': 'Delhi District Courts', 'type': 'District Court'},
         {'id': 'faridabad-district', 'name': 'Faridabad District Court', 'type': 'District Court'}
     ]
-    return jsonify(courts)
+    # The list is constant: let browsers and CDNs keep it for an hour and
+    # revalidate with the ETag, so warm hits cost the server nothing
+    resp = jsonify(courts)
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    resp.add_etag()
+    return resp.make_conditional(request)
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.utcnow().isoformat()})
+    resp = jsonify({'status': 'healthy', 'timestamp': datetime.utcnow().isoformat()})
+    resp.headers['Cache-Control'] = 'public, max-age=5'
+    return resp
 
 # Error handlers
 @app.errorhandler(404)
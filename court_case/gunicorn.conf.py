@@ -0,0 +1,14 @@
+# Gunicorn configuration for production
+# Run from this directory with: gunicorn -c gunicorn.conf.py app:app
+#
+# gevent workers multiplex the I/O-bound search requests, so one process
+# handles dozens of concurrent court lookups instead of one per thread.
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', '4'))
+worker_connections = 100
+
+# Make app.py patch psycopg2 for gevent before the engine is created
+raw_env = ['GEVENT_WORKERS=1']